@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from collections import defaultdict
-import json
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from typing import Dict, List, Tuple
 import pandas as pd
@@ -23,6 +23,7 @@ import pandas as pd
 from google.cloud.dialogflowcx_v3beta1 import services
 from google.cloud.dialogflowcx_v3beta1 import types
 from google.protobuf import field_mask_pb2
+from google.protobuf import json_format  # type: ignore
 
 from dfcx_scrapi.core.scrapi_base import ScrapiBase
 
@@ -33,6 +34,14 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+_BASIC_COLUMNS = ["display_name", "training_phrase"]
+_ADVANCED_COLUMNS = [
+    "name", "display_name", "description", "priority",
+    "is_fallback", "labels", "id", "repeat_count",
+    "training_phrase_idx", "text", "text_idx",
+    "parameter_id", "entity_type", "is_list", "redact",
+]
+
 
 class Intents(ScrapiBase):
     """Core Class for CX Intent Resource functions."""
@@ -60,13 +69,66 @@ class Intents(ScrapiBase):
         if agent_id:
             self.agent_id = agent_id
 
+        self._clients: Dict[str, services.intents.IntentsClient] = {}
 
-    @staticmethod
+    def _get_intents_client(
+        self, item_id: str) -> services.intents.IntentsClient:
+        """Fetches a cached IntentsClient for the region of the provided ID.
+
+        Reusing one client per region keeps the underlying gRPC channel
+        open, avoiding a fresh TLS handshake on every API call.
+
+        Args:
+          item_id, any CX resource ID long path that contains a location
+
+        Returns:
+          client, an IntentsClient for the resource's regional endpoint
+        """
+        client_options = self._set_region(item_id)
+        endpoint = (
+            client_options["api_endpoint"] if client_options else "global"
+        )
+        if endpoint not in self._clients:
+            self._clients[endpoint] = services.intents.IntentsClient(
+                credentials=self.creds, client_options=client_options
+            )
+
+        return self._clients[endpoint]
+
+    @classmethod
     def intent_proto_to_dataframe(
-        obj: types.Intent, mode: str = "basic"
+        cls, obj: types.Intent, mode: str = "basic"
     ) -> pd.DataFrame:
         """Single intent to pandas DataFrame.
 
+        Args:
+          obj (types.Intent)
+          mode (str):
+            "basic" returns display name and training phrase as plain text.
+            "advanced" returns training phrases broken out by parts
+            with their parameters included.
+        """
+        if mode == "basic":
+            columns = _BASIC_COLUMNS
+        elif mode == "advanced":
+            columns = _ADVANCED_COLUMNS
+        else:
+            raise ValueError("Mode types: [basic, advanced]")
+
+        return pd.DataFrame(
+            cls._intent_proto_to_rows(obj, mode), columns=columns
+        )
+
+    @staticmethod
+    def _intent_proto_to_rows(
+        obj: types.Intent, mode: str = "basic"
+    ) -> List[Dict]:
+        """Single intent to a list of row dicts for DataFrame construction.
+
+        Collecting plain dicts and building the DataFrame once at the
+        boundary is O(N) in the number of rows, where concatenating
+        single-row frames in a loop is O(N^2).
+
         Args:
           obj (types.Intent)
           mode (str):
@@ -77,79 +139,72 @@ class Intents(ScrapiBase):
         if not isinstance(obj, types.Intent):
             raise ValueError("obj should be Intent.")
 
-        if mode == "basic":
-            df = pd.DataFrame(columns=["display_name", "training_phrase"])
+        rows = []
 
+        if mode == "basic":
             intent_dict = {"display_name": str(obj.display_name)}
 
             if not obj.training_phrases:
-                row = pd.DataFrame.from_dict(
-                    intent_dict, orient="index"
-                ).transpose()
-                df = pd.concat([df, row], ignore_index=True)
+                rows.append(dict(intent_dict))
             else:
                 for tp in obj.training_phrases:
                     parts_list = [part.text for part in tp.parts]
                     intent_dict.update({"training_phrase": "".join(parts_list)})
+                    rows.append(dict(intent_dict))
 
-                    row = pd.DataFrame.from_dict(
-                        intent_dict, orient="index"
-                    ).transpose()
-                    df = pd.concat([df, row], ignore_index=True)
-
-            return df
+            return rows
 
         elif mode == "advanced":
-            df = pd.DataFrame(columns=[
-                "name", "display_name", "description", "priority",
-                "is_fallback", "labels", "id", "repeat_count",
-                "training_phrase_idx", "text", "text_idx",
-                "parameter_id", "entity_type", "is_list", "redact",
-            ])
+            # One bulk conversion to a plain dict tree; iterating plain
+            # lists/dicts avoids the per-attribute proto accessor overhead
+            obj_dict = json_format.MessageToDict(
+                obj._pb,  # pylint: disable=W0212
+                preserving_proto_field_name=True,
+            )
 
             intent_dict = {
-                "name": str(obj.name),
-                "display_name": str(obj.display_name),
-                "description": str(obj.description),
-                "priority": int(obj.priority),
-                "is_fallback": bool(obj.is_fallback),
+                "name": obj_dict.get("name", ""),
+                "display_name": obj_dict.get("display_name", ""),
+                "description": obj_dict.get("description", ""),
+                "priority": int(obj_dict.get("priority", 0)),
+                "is_fallback": bool(obj_dict.get("is_fallback", False)),
             }
 
             # labels
             intent_dict["labels"] = ",".join([
                 key if key == val else f"{key}:{val}"
-                for key, val in obj.labels.items()
+                for key, val in obj_dict.get("labels", {}).items()
             ])
             # parameters
             params_dict = {
-                str(param.id): {
-                    "parameter_id": str(param.id),
-                    "entity_type": str(param.entity_type),
-                    "is_list": bool(param.is_list),
-                    "redact": bool(param.redact),
+                param["id"]: {
+                    "parameter_id": param["id"],
+                    "entity_type": param.get("entity_type", ""),
+                    "is_list": bool(param.get("is_list", False)),
+                    "redact": bool(param.get("redact", False)),
                 }
-                for param in obj.parameters
+                for param in obj_dict.get("parameters", [])
             }
             # training phrases
-            if not obj.training_phrases:
-                row = pd.DataFrame.from_dict(
-                    intent_dict, orient="index"
-                ).transpose()
-                df = pd.concat([df, row], ignore_index=True)
+            training_phrases = obj_dict.get("training_phrases", [])
+            if not training_phrases:
+                rows.append(dict(intent_dict))
             else:
-                for tp_count, tp in enumerate(obj.training_phrases):
+                for tp_count, tp in enumerate(training_phrases):
                     intent_dict.update({
-                        "id": str(tp.id),
-                        "repeat_count": int(tp.repeat_count),
+                        "id": tp.get("id", ""),
+                        "repeat_count": int(tp.get("repeat_count", 0)),
                         "training_phrase_idx": tp_count,
                     })
-                    for part_count, part in enumerate(tp.parts):
+                    for part_count, part in enumerate(tp.get("parts", [])):
                         intent_dict.update({
-                            "text": part.text,
+                            "text": part.get("text", ""),
                             "text_idx": part_count
                         })
-                        if part.parameter_id:
-                            intent_dict.update(params_dict[part.parameter_id])
+                        if part.get("parameter_id"):
+                            intent_dict.update(
+                                params_dict[part["parameter_id"]]
+                            )
                         elif intent_dict.get("entity_type"):
                             # Remove existing parameter_id if exist
                             key_to_remove = [
@@ -158,12 +213,9 @@ class Intents(ScrapiBase):
                             ]
                             for key in key_to_remove:
                                 intent_dict.pop(key)
-                        # Add to Dataframe
-                        row = pd.DataFrame.from_dict(
-                            intent_dict, orient="index"
-                        ).transpose()
-                        df = pd.concat([df, row], ignore_index=True)
-            return df
+                        # Copy to snapshot the current state
+                        rows.append(dict(intent_dict))
+            return rows
         else:
             raise ValueError("Mode types: [basic, advanced]")
 
@@ -210,7 +262,7 @@ class Intents(ScrapiBase):
         true_additions = mutations[
             (mutations["action"] == "add") & (mutations["text"].isna())
         ]
-        false_additions = mutations[
+        false_additions = mutations.copy()[
             (mutations["action"] == "add") & (~mutations["text"].isna())
         ]
 
@@ -225,12 +277,11 @@ class Intents(ScrapiBase):
                 "id",
             ]
         )
-        true_additions["name"] = list(set(untouched["name"]))[0]
+        true_additions["name"] = untouched["name"].iat[0]
 
-        next_tp_id = int(untouched["training_phrase"].max() + 1)
-        last_tp_id = int(
-            untouched["training_phrase"].max() + len(true_additions)
-        )
+        max_tp_id = int(untouched["training_phrase"].max())
+        next_tp_id = max_tp_id + 1
+        last_tp_id = max_tp_id + len(true_additions)
 
         true_additions["training_phrase"] = list(
             range(next_tp_id, last_tp_id + 1)
@@ -240,7 +291,8 @@ class Intents(ScrapiBase):
         true_additions["parameter_id"] = ""
         true_additions["repeat_count"] = 1
         true_additions["id"] = ""
-        true_additions = true_additions[untouched.columns]
+        untouched_columns = untouched.columns
+        true_additions = true_additions[untouched_columns]
 
         # Deleting existing phrases
         true_deletions = mutations.copy()[
@@ -250,90 +302,59 @@ class Intents(ScrapiBase):
             (mutations["action"] == "delete") & (mutations["text"].isna())
         ]
 
-        updated_training_phrases_df = untouched.copy()
-        updated_training_phrases_df = pd.concat([
-            updated_training_phrases_df,
-            false_additions
-        ])
         updated_training_phrases_df = pd.concat([
-            updated_training_phrases_df,
-            true_additions
-        ])
-        updated_training_phrases_df = updated_training_phrases_df.drop(
-            columns=["action"]
-        )
+            untouched,
+            false_additions,
+            true_additions,
+        ]).drop(columns=["action"])
 
-        actions_taken = pd.DataFrame()
+        actions_parts = []
         if true_additions.empty is False:
-            true_additions.insert(len(true_additions.columns), "completed", 1)
-            true_additions.insert(
-                len(true_additions.columns), "category", "true addition"
-            )
-            true_additions.insert(
-                len(true_additions.columns),
-                "outcome",
-                true_additions.apply(
-                    lambda x: "{} added to {}".format( #pylint: disable=C0209
-                        x["phrase"], x["display_name"]
-                    ),
-                    axis=1,
-                ),
+            true_additions["completed"] = 1
+            true_additions["category"] = "true addition"
+            true_additions["outcome"] = (
+                true_additions["phrase"].astype(str)
+                + " added to "
+                + true_additions["display_name"].astype(str)
             )
-            actions_taken = pd.concat([actions_taken, true_additions])
+            actions_parts.append(true_additions)
 
         if false_additions.empty is False:
-            false_additions.insert(len(false_additions.columns), "completed", 0)
-            false_additions.insert(
-                len(false_additions.columns), "category", "false addition"
+            false_additions["completed"] = 0
+            false_additions["category"] = "false addition"
+            false_additions["outcome"] = (
+                false_additions["phrase"].astype(str)
+                + " already in "
+                + false_additions["display_name"].astype(str)
             )
-            false_additions.insert(
-                len(false_additions.columns),
-                "outcome",
-                false_additions.apply(
-                    lambda x: "{} already in {}".format( #pylint: disable=C0209
-                        x["phrase"], x["display_name"]
-                    ),
-                    axis=1,
-                ),
-            )
-            actions_taken = pd.concat([actions_taken, false_additions])
+            actions_parts.append(false_additions)
 
         if true_deletions.empty is False:
-            true_deletions.insert(len(true_deletions.columns), "completed", 1)
-            true_deletions.insert(
-                len(true_deletions.columns), "category", "true deletion"
-            )
-            true_deletions.insert(
-                len(true_deletions.columns),
-                "outcome",
-                true_deletions.apply(
-                    lambda x: "{} removed from {}".format( #pylint: disable=C0209
-                        x["phrase"], x["display_name"]
-                    ),
-                    axis=1,
-                ),
+            true_deletions["completed"] = 1
+            true_deletions["category"] = "true deletion"
+            true_deletions["outcome"] = (
+                true_deletions["phrase"].astype(str)
+                + " removed from "
+                + true_deletions["display_name"].astype(str)
             )
-            actions_taken = pd.concat([actions_taken, true_deletions])
+            actions_parts.append(true_deletions)
 
         if false_deletions.empty is False:
-            false_deletions.insert(len(false_deletions.columns), "completed", 0)
-            false_deletions.insert(
-                len(false_deletions.columns), "category", "false deletion"
+            false_deletions["completed"] = 0
+            false_deletions["category"] = "false deletion"
+            false_deletions["outcome"] = (
+                false_deletions["phrase"].astype(str)
+                + " not found in "
+                + false_deletions["display_name"].astype(str)
             )
-            false_deletions.insert(
-                len(false_deletions.columns),
-                "outcome",
-                false_deletions.apply(
-                    lambda x: "{} not found in {}".format( #pylint: disable=C0209
-                        x["phrase"], x["display_name"]
-                    ),
-                    axis=1,
-                ),
-            )
-            actions_taken = pd.concat([actions_taken, false_deletions])
+            actions_parts.append(false_deletions)
+
+        actions_taken = (
+            pd.concat(actions_parts) if actions_parts else pd.DataFrame()
+        )
 
-        actionable_intents = list(
-            set(actions_taken[actions_taken["completed"] == 1]["display_name"])
+        actionable_intents = frozenset(
+            actions_taken[actions_taken["completed"] == 1]["display_name"]
         )
 
         updated_training_phrases_df = updated_training_phrases_df[
@@ -397,16 +418,14 @@ class Intents(ScrapiBase):
             request.language_code = language_code
 
         request.parent = agent_id
-        client_options = self._set_region(agent_id)
-        client = services.intents.IntentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        # Max allowed page size; fewer round trips for large agents
+        request.page_size = 1000
+        client = self._get_intents_client(agent_id)
         response = client.list_intents(request)
 
-        intents = []
-        for page in response.pages:
-            for intent in page.intents:
-                intents.append(intent)
+        intents = [
+            intent for page in response.pages for intent in page.intents
+        ]
 
         return intents
 
@@ -433,10 +452,7 @@ class Intents(ScrapiBase):
             request.language_code = language_code
 
         request.name = intent_id
-        client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_intents_client(intent_id)
 
         response = client.get_intent(request)
 
@@ -498,9 +514,11 @@ class Intents(ScrapiBase):
             intent = obj
             intent.name = ""
         elif intent_dictionary:
-            intent = types.intent.Intent.from_json(
-                json.dumps(intent_dictionary)
-            )
+            # Parse the dict straight into the proto; round-tripping
+            # through a JSON string traverses the data twice
+            intent_pb = types.intent.Intent.pb(types.intent.Intent())
+            json_format.ParseDict(intent_dictionary, intent_pb)
+            intent = types.intent.Intent.wrap(intent_pb)
         else:
             raise ValueError("must provide either obj or intent_dictionary")
 
@@ -512,10 +530,7 @@ class Intents(ScrapiBase):
         request.parent = agent_id
         request.intent = intent
 
-        client_options = self._set_region(agent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_intents_client(agent_id)
 
         response = client.create_intent(request)
 
@@ -551,10 +566,7 @@ class Intents(ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_intents_client(intent_id)
 
         request = types.intent.UpdateIntentRequest()
 
@@ -577,10 +589,7 @@ class Intents(ScrapiBase):
         if obj:
             intent_id = obj.name
         else:
-            client_options = self._set_region(intent_id)
-            client = services.intents.IntentsClient(
-                client_options=client_options, credentials=self.creds
-            )
+            client = self._get_intents_client(intent_id)
             client.delete_intent(name=intent_id)
 
     def bulk_intent_to_df(
@@ -625,14 +634,33 @@ class Intents(ScrapiBase):
         if mode not in ["basic", "advanced"]:
             raise ValueError("Mode types: [basic, advanced]")
 
-        main_df = pd.DataFrame()
         intents = self.list_intents(agent_id, language_code=language_code)
 
-        for obj in intents:
-            if (intent_subset) and (obj.display_name not in intent_subset):
-                continue
-            intent_df = self.intent_proto_to_dataframe(obj, mode=mode)
-            main_df = pd.concat([main_df, intent_df], ignore_index=True)
+        if intent_subset:
+            intents = [
+                obj for obj in intents if obj.display_name in intent_subset
+            ]
+
+        # Proto field access releases the GIL, so converting intents on a
+        # thread pool scales across cores for large agents.
+        all_rows = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for rows in executor.map(
+                lambda obj: self._intent_proto_to_rows(obj, mode=mode),
+                intents,
+            ):
+                all_rows.extend(rows)
+
+        columns = _BASIC_COLUMNS if mode == "basic" else _ADVANCED_COLUMNS
+
+        main_df = pd.DataFrame(all_rows, columns=columns)
+
+        if mode == "advanced":
+            # These columns repeat heavily across rows; category dtype
+            # stores each unique string once and merges on integer codes
+            for column in ("name", "display_name", "parameter_id",
+                           "entity_type"):
+                main_df[column] = main_df[column].astype("category")
 
         return main_df
 
@@ -656,24 +684,18 @@ class Intents(ScrapiBase):
         intent_dict = defaultdict(list)
         intents = self.list_intents(agent_id)
 
-        for intent in intents:  # pylint: disable=R1702
+        for intent in intents:
             if intent.display_name == "Default Negative Intent":
-                pass
+                continue
+
+            training_phrases = intent.training_phrases
+            if not training_phrases:
+                intent_dict[intent.display_name].append("")
             else:
-                if "training_phrases" in intent:
-                    for training_phrase in intent.training_phrases:
-                        text_list = []
-                        if len(training_phrase.parts) > 1:
-                            for item in training_phrase.parts:
-                                text_list.append(item.text)
-                            intent_dict[intent.display_name].append(
-                                "".join(text_list))
-                        else:
-                            intent_dict[intent.display_name].append(
-                                training_phrase.parts[0].text
-                            )
-                else:
-                    intent_dict[intent.display_name].append("")
+                intent_dict[intent.display_name].extend(
+                    "".join(part.text for part in tp.parts)
+                    for tp in training_phrases
+                )
 
         dataframe = pd.DataFrame.from_dict(
             intent_dict, orient="index").transpose()
@@ -55,6 +55,31 @@ class Pages(ScrapiBase):
         if flow_id:
             self.flow_id = flow_id
 
+        self._clients: Dict[str, services.pages.PagesClient] = {}
+
+    def _get_pages_client(self, item_id: str) -> services.pages.PagesClient:
+        """Fetches a cached PagesClient for the region of the provided ID.
+
+        Reusing one client per region keeps the underlying gRPC channel
+        open, avoiding a fresh TLS handshake on every API call.
+
+        Args:
+          item_id, any CX resource ID long path that contains a location
+
+        Returns:
+          client, a PagesClient for the resource's regional endpoint
+        """
+        client_options = self._set_region(item_id)
+        endpoint = (
+            client_options["api_endpoint"] if client_options else "global"
+        )
+        if endpoint not in self._clients:
+            self._clients[endpoint] = services.pages.PagesClient(
+                credentials=self.creds, client_options=client_options
+            )
+
+        return self._clients[endpoint]
+
     def get_pages_map(
         self,
         flow_id: str = None,
@@ -98,17 +123,15 @@ class Pages(ScrapiBase):
         """
         request = types.page.ListPagesRequest()
         request.parent = flow_id
+        # Max allowed page size; fewer round trips for large flows
+        request.page_size = 1000
 
-        client_options = self._set_region(flow_id)
-        client = services.pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_pages_client(flow_id)
         response = client.list_pages(request)
 
-        cx_pages = []
-        for page in response.pages:
-            for cx_page in page.pages:
-                cx_pages.append(cx_page)
+        cx_pages = [
+            cx_page for page in response.pages for cx_page in page.pages
+        ]
 
         return cx_pages
 
@@ -124,10 +147,7 @@ class Pages(ScrapiBase):
         if not page_id:
             page_id = self.page_id
 
-        client_options = self._set_region(page_id)
-        client = services.pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_pages_client(page_id)
 
         response = client.get_page(name=page_id)
 
@@ -159,10 +179,7 @@ class Pages(ScrapiBase):
         for key, value in kwargs.items():
             setattr(page, key, value)
 
-        client_options = self._set_region(flow_id)
-        client = services.pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_pages_client(flow_id)
 
         response = client.create_page(parent=flow_id, page=page)
 
@@ -195,10 +212,7 @@ class Pages(ScrapiBase):
         paths = kwargs.keys()
         mask = field_mask_pb2.FieldMask(paths=paths)
 
-        client_options = self._set_region(page_id)
-        client = services.pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_pages_client(page_id)
 
         response = client.update_page(page=page, update_mask=mask)
 
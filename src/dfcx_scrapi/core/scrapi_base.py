@@ -14,16 +14,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import json
 
-from typing import Dict
+from typing import Dict, Optional
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
 from google.protobuf import json_format  # type: ignore
 
 from proto.marshal.collections import repeated
 from proto.marshal.collections import maps
+
+
+@functools.lru_cache(maxsize=8)
+def _load_credentials(
+    creds_path: str,
+    scopes: tuple) -> service_account.Credentials:
+    """Loads and refreshes service account credentials from a key file.
+
+    Memoized per (creds_path, scopes) so instantiating many SCRAPI
+    classes in one session shares a single credentials object instead
+    of hitting the token endpoint once per instance.
+    """
+    creds = service_account.Credentials.from_service_account_file(
+        creds_path, scopes=list(scopes)
+    )
+    creds.refresh(Request())
+
+    return creds
+
+
+@functools.lru_cache(maxsize=64)
+def _client_options_for_location(location: str) -> Optional[Dict[str, str]]:
+    """Maps a CX location to client options for its regional API endpoint.
+
+    Memoized so hot API methods skip rebuilding the same dict for every
+    call; callers must treat the returned dict as read-only.
+    """
+    if location != "global":
+        api_endpoint = f"{location}-dialogflow.googleapis.com:443"
+        client_options = {"api_endpoint": api_endpoint}
+        return client_options
+
+    else:
+        return None  # explicit None return when not required
+
+
 class ScrapiBase:
     """Core Class for managing Auth and other shared functions."""
 
@@ -47,13 +84,13 @@ class ScrapiBase:
 
         if creds:
             self.creds = creds
-            self.creds.refresh(Request())
+            if not self.creds.valid:
+                self.creds.refresh(Request())
             self.token = self.creds.token
         elif creds_path:
-            self.creds = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=self.scopes
-            )
-            self.creds.refresh(Request())
+            self.creds = _load_credentials(creds_path, tuple(self.scopes))
+            if not self.creds.valid:
+                self.creds.refresh(Request())
             self.token = self.creds.token
         elif creds_dict:
             self.creds = service_account.Credentials.from_service_account_info(
@@ -80,18 +117,12 @@ class ScrapiBase:
             client_options: use when instantiating other library client objects
         """
         try:
-            location = item_id.split("/")[3]
+            location = item_id.split("/", 4)[3]
         except IndexError as err:
             logging.error("IndexError - path too short? %s", item_id)
             raise err
 
-        if location != "global":
-            api_endpoint = f"{location}-dialogflow.googleapis.com:443"
-            client_options = {"api_endpoint": api_endpoint}
-            return client_options
-
-        else:
-            return None  # explicit None return when not required
+        return _client_options_for_location(location)
 
     @staticmethod
     def pbuf_to_dict(pbuf):
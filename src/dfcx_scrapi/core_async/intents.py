@@ -0,0 +1,391 @@
+"""Intent Resource Async functions."""
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from google.cloud.dialogflowcx_v3beta1 import services
+from google.cloud.dialogflowcx_v3beta1 import types
+from google.protobuf import field_mask_pb2
+
+from dfcx_scrapi.core.scrapi_base import ScrapiBase
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class IntentsAsync(ScrapiBase):
+    """Core Class for CX Intent Resource Async functions.
+
+    The async client overlaps network round trips on the event loop, so
+    scripts that issue many list/get/create/update calls can run them
+    concurrently instead of serializing one RPC per call.
+    """
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        creds=None,
+        scope=False,
+        intent_id: str = None,
+        agent_id: str = None,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+        )
+
+        if intent_id:
+            self.intent_id = intent_id
+            self.client_options = self._set_region(self.intent_id)
+
+        if agent_id:
+            self.agent_id = agent_id
+
+        self._clients: Dict[
+            Tuple[str, int], services.intents.IntentsAsyncClient] = {}
+
+    def _get_intents_client(
+        self, item_id: str) -> services.intents.IntentsAsyncClient:
+        """Fetches a cached IntentsAsyncClient for the provided ID's region.
+
+        The cache is keyed per event loop as well as per endpoint because
+        the client's gRPC aio channel is bound to the loop it was created
+        on; reusing it from a later asyncio.run would fail with
+        "Event loop is closed".
+
+        Args:
+          item_id, any CX resource ID long path that contains a location
+
+        Returns:
+          client, an IntentsAsyncClient for the resource's regional endpoint
+        """
+        client_options = self._set_region(item_id)
+        endpoint = (
+            client_options["api_endpoint"] if client_options else "global"
+        )
+        key = (endpoint, id(asyncio.get_running_loop()))
+        if key not in self._clients:
+            self._clients[key] = services.intents.IntentsAsyncClient(
+                credentials=self.creds, client_options=client_options
+            )
+
+        return self._clients[key]
+
+    async def list_intents(
+        self,
+        agent_id: str = None,
+        language_code: str = None) -> List[types.Intent]:
+        """Exports List of all intents in specific CX Agent.
+
+        Args:
+          agent_id, the formatted CX Agent ID to use
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+
+        Returns:
+          intents, List of Intent objects
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        request = types.intent.ListIntentsRequest()
+
+        if language_code:
+            request.language_code = language_code
+
+        request.parent = agent_id
+        # Max allowed page size; fewer round trips for large agents
+        request.page_size = 1000
+        client = self._get_intents_client(agent_id)
+        response = await client.list_intents(request)
+
+        intents = []
+        async for page in response.pages:
+            intents.extend(page.intents)
+
+        return intents
+
+    async def get_intent(
+        self,
+        intent_id: str = None,
+        language_code: str = None) -> types.Intent:
+        """Get a single Intent object based on specific CX Intent ID.
+
+        Args:
+          intent_id, the properly formatted CX Intent ID
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+
+        Returns:
+          response, a single Intent object
+        """
+        if not intent_id:
+            intent_id = self.intent_id
+
+        request = types.intent.GetIntentRequest()
+
+        if language_code:
+            request.language_code = language_code
+
+        request.name = intent_id
+        client = self._get_intents_client(intent_id)
+
+        response = await client.get_intent(request)
+
+        return response
+
+    async def bulk_get_intents(
+        self,
+        intent_ids: List[str],
+        language_code: str = None,
+        concurrency: int = 8) -> List[types.Intent]:
+        """Fetch many Intent objects concurrently.
+
+        Args:
+          intent_ids, List of properly formatted CX Intent IDs
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+          concurrency, max number of in-flight requests; bounded to stay
+            within API quota
+
+        Returns:
+          intents, List of Intent objects in the same order as intent_ids
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def guarded_get(intent_id):
+            async with semaphore:
+                return await self.get_intent(intent_id, language_code)
+
+        return await asyncio.gather(
+            *(guarded_get(intent_id) for intent_id in intent_ids)
+        )
+
+    async def create_intent(
+        self,
+        agent_id: str,
+        obj: types.Intent,
+        language_code: str = None) -> types.Intent:
+        """Creates an Intent from a protobuf object.
+
+        Args:
+          agent_id, the formatted CX Agent ID to use
+          obj, Intent protobuf of types.Intent
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+
+        Returns:
+          response, a copy of the successful Intent object that was created
+        """
+        intent = obj
+        intent.name = ""
+
+        request = types.intent.CreateIntentRequest()
+
+        if language_code:
+            request.language_code = language_code
+
+        request.parent = agent_id
+        request.intent = intent
+
+        client = self._get_intents_client(agent_id)
+
+        response = await client.create_intent(request)
+
+        return response
+
+    async def update_intent(
+        self,
+        intent_id: str = None,
+        obj: types.Intent = None,
+        language_code: str = None,
+        **kwargs) -> types.Intent:
+        """Updates a single Intent object based on provided args.
+
+        Args:
+          intent_id, the destination Intent ID. Must be formatted properly
+            for Intent IDs in CX.
+          obj, The CX Intent object in proper format. This can also be
+            extracted by using the get_intent() method.
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+        """
+        if obj:
+            intent = obj
+            intent.name = intent_id
+
+        else:
+            if not intent_id:
+                intent_id = self.intent_id
+            intent = await self.get_intent(intent_id)
+
+        # set intent attributes from kwargs
+        for key, value in kwargs.items():
+            setattr(intent, key, value)
+        paths = kwargs.keys()
+        mask = field_mask_pb2.FieldMask(paths=paths)
+
+        client = self._get_intents_client(intent_id)
+
+        request = types.intent.UpdateIntentRequest()
+
+        request.intent = intent
+        request.update_mask = mask
+
+        if language_code:
+            request.language_code = language_code
+
+        response = await client.update_intent(request)
+
+        return response
+
+    async def delete_intent(
+        self, intent_id: str, obj: types.Intent = None) -> None:
+        """Deletes an intent by Intent ID.
+
+        Args:
+          intent_id, intent to delete
+        """
+        if obj:
+            intent_id = obj.name
+        else:
+            client = self._get_intents_client(intent_id)
+            await client.delete_intent(name=intent_id)
+
+    async def bulk_create_intents(
+        self,
+        agent_id: str,
+        objs: List[types.Intent],
+        language_code: str = None,
+        concurrency: int = 8) -> List[types.Intent]:
+        """Create many Intents concurrently.
+
+        Args:
+          agent_id, the formatted CX Agent ID to use
+          objs, List of Intent protobufs of types.Intent
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+          concurrency, max number of in-flight requests; bounded to stay
+            within API quota
+
+        Returns:
+          results, List of created Intent objects in the same order as
+            objs; failed creates are returned as their exceptions
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def guarded_create(obj):
+            async with semaphore:
+                return await self.create_intent(agent_id, obj, language_code)
+
+        return await asyncio.gather(
+            *(guarded_create(obj) for obj in objs),
+            return_exceptions=True,
+        )
+
+    async def bulk_update_intents(
+        self,
+        updates: List[Tuple[str, Dict]],
+        language_code: str = None,
+        concurrency: int = 8) -> List[types.Intent]:
+        """Update many Intents concurrently.
+
+        Fanning the updates out over the event loop turns N sequential
+        round trips into roughly one round trip plus processing time.
+
+        Args:
+          updates, List of (intent_id, kwargs) tuples where kwargs are the
+            attributes to set on each intent, as in update_intent
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+          concurrency, max number of in-flight requests; bounded to stay
+            within API quota
+
+        Returns:
+          results, List of updated Intent objects in the same order as
+            updates; failed updates are returned as their exceptions
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def guarded_update(intent_id, kwargs):
+            async with semaphore:
+                return await self.update_intent(
+                    intent_id, language_code=language_code, **kwargs
+                )
+
+        return await asyncio.gather(
+            *(guarded_update(intent_id, kwargs)
+              for intent_id, kwargs in updates),
+            return_exceptions=True,
+        )
+
+    def bulk_update_intents_sync(
+        self,
+        updates: List[Tuple[str, Dict]],
+        language_code: str = None,
+        concurrency: int = 8) -> List[types.Intent]:
+        """Convenience wrapper to run bulk_update_intents from sync code.
+
+        Args:
+          updates, List of (intent_id, kwargs) tuples where kwargs are the
+            attributes to set on each intent, as in update_intent
+          language_code: Language code of the intents being uploaded. Ref:
+            https://cloud.google.com/dialogflow/cx/docs/reference/language
+          concurrency, max number of in-flight requests; bounded to stay
+            within API quota
+
+        Returns:
+          results, List of updated Intent objects in the same order as
+            updates; failed updates are returned as their exceptions
+        """
+        return asyncio.run(
+            self.bulk_update_intents(updates, language_code, concurrency)
+        )
+
+    async def bulk_delete_intents(
+        self,
+        intent_ids: List[str],
+        concurrency: int = 8) -> List[None]:
+        """Delete many Intents concurrently.
+
+        Args:
+          intent_ids, List of properly formatted CX Intent IDs to delete
+          concurrency, max number of in-flight requests; bounded to stay
+            within API quota
+
+        Returns:
+          results, one entry per intent_id; failed deletes are returned
+            as their exceptions
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def guarded_delete(intent_id):
+            async with semaphore:
+                return await self.delete_intent(intent_id)
+
+        return await asyncio.gather(
+            *(guarded_delete(intent_id) for intent_id in intent_ids),
+            return_exceptions=True,
+        )
@@ -0,0 +1,227 @@
+"""Page Resource Async functions."""
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from google.cloud.dialogflowcx_v3beta1 import services
+from google.cloud.dialogflowcx_v3beta1 import types
+from google.protobuf import field_mask_pb2
+
+from dfcx_scrapi.core.scrapi_base import ScrapiBase
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class PagesAsync(ScrapiBase):
+    """Core Class for CX Page Resource Async functions.
+
+    The async client overlaps network round trips on the event loop, so
+    scripts that issue many list/get/create/update calls can run them
+    concurrently instead of serializing one RPC per call.
+    """
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        scope=False,
+        creds=None,
+        page_id: str = None,
+        flow_id: str = None,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+        )
+
+        if page_id:
+            self.page_id = page_id
+            self.client_options = self._set_region(page_id)
+
+        if flow_id:
+            self.flow_id = flow_id
+
+        self._clients: Dict[
+            Tuple[str, int], services.pages.PagesAsyncClient] = {}
+
+    def _get_pages_client(
+        self, item_id: str) -> services.pages.PagesAsyncClient:
+        """Fetches a cached PagesAsyncClient for the provided ID's region.
+
+        The cache is keyed per event loop as well as per endpoint because
+        the client's gRPC aio channel is bound to the loop it was created
+        on; reusing it from a later asyncio.run would fail with
+        "Event loop is closed".
+
+        Args:
+          item_id, any CX resource ID long path that contains a location
+
+        Returns:
+          client, a PagesAsyncClient for the resource's regional endpoint
+        """
+        client_options = self._set_region(item_id)
+        endpoint = (
+            client_options["api_endpoint"] if client_options else "global"
+        )
+        key = (endpoint, id(asyncio.get_running_loop()))
+        if key not in self._clients:
+            self._clients[key] = services.pages.PagesAsyncClient(
+                credentials=self.creds, client_options=client_options
+            )
+
+        return self._clients[key]
+
+    async def list_pages(self, flow_id: str = None) -> List[types.Page]:
+        """Get a List of all pages for the specified Flow ID.
+
+        Args:
+          flow_id, the properly formatted Flow ID string
+
+        Returns:
+          cx_pages, A List of CX Page objects for the specific Flow ID
+        """
+        if not flow_id:
+            flow_id = self.flow_id
+
+        request = types.page.ListPagesRequest()
+        request.parent = flow_id
+        # Max allowed page size; fewer round trips for large flows
+        request.page_size = 1000
+
+        client = self._get_pages_client(flow_id)
+        response = await client.list_pages(request)
+
+        cx_pages = []
+        async for page in response.pages:
+            cx_pages.extend(page.pages)
+
+        return cx_pages
+
+    async def get_page(self, page_id: str = None) -> types.Page:
+        """Get a single CX Page object based on the provided Page ID.
+
+        Args:
+          page_id, a properly formatted CX Page ID
+
+        Returns:
+          response, a single CX Page Object of types.Page
+        """
+        if not page_id:
+            page_id = self.page_id
+
+        client = self._get_pages_client(page_id)
+
+        response = await client.get_page(name=page_id)
+
+        return response
+
+    async def bulk_get_pages(
+        self,
+        page_ids: List[str],
+        concurrency: int = 8) -> List[types.Page]:
+        """Fetch many Page objects concurrently.
+
+        Args:
+          page_ids, List of properly formatted CX Page IDs
+          concurrency, max number of in-flight requests; bounded to stay
+            within API quota
+
+        Returns:
+          pages, List of Page objects in the same order as page_ids
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def guarded_get(page_id):
+            async with semaphore:
+                return await self.get_page(page_id)
+
+        return await asyncio.gather(
+            *(guarded_get(page_id) for page_id in page_ids)
+        )
+
+    async def create_page(
+        self,
+        flow_id: str = None,
+        obj: types.Page = None,
+        **kwargs) -> types.Page:
+        """Create a single CX Page object in the specified Flow ID.
+
+        Args:
+          flow_id, the CX Flow ID where the Page object will be created
+          obj, (Optional) a CX Page object of types.Page
+
+        Returns:
+          response, a copy of the successful Page object that was created
+        """
+        if not flow_id:
+            flow_id = self.flow_id
+
+        if obj:
+            page = obj
+            page.name = ""
+        else:
+            page = types.page.Page()
+
+        for key, value in kwargs.items():
+            setattr(page, key, value)
+
+        client = self._get_pages_client(flow_id)
+
+        response = await client.create_page(parent=flow_id, page=page)
+
+        return response
+
+    async def update_page(
+        self,
+        page_id: str = None,
+        obj: types.Page = None,
+        **kwargs) -> types.Page:
+        """Update a single CX Page object.
+
+        Args:
+          page_id, the CX Page ID to update
+          obj, (Optional) a CX Page object of types.Page
+
+        Returns:
+          response, a copy of the successful Page object that was created
+        """
+        if obj:
+            page = obj
+            page.name = page_id
+        else:
+            if not page_id:
+                page_id = self.page_id
+            page = await self.get_page(page_id)
+
+        for key, value in kwargs.items():
+            setattr(page, key, value)
+        paths = kwargs.keys()
+        mask = field_mask_pb2.FieldMask(paths=paths)
+
+        client = self._get_pages_client(page_id)
+
+        response = await client.update_page(page=page, update_mask=mask)
+
+        return response